@@ -180,6 +180,12 @@ class Product(db.Model):
         logger.info("Processing all Products")
         return cls.query.all()
 
+    @classmethod
+    def count(cls) -> int:
+        """Returns the number of Products in the database"""
+        logger.info("Processing count of all Products")
+        return db.session.query(db.func.count(cls.id)).scalar()
+
     @classmethod
     def find(cls, product_id: int):
         """Finds a Product by it's ID
@@ -29,9 +29,10 @@ import logging
 from urllib.parse import quote_plus
 from decimal import Decimal
 from unittest import TestCase
+from sqlalchemy import text
 from service import app
 from service.common import status
-from service.models import db, init_db, Product
+from service.models import db, init_db
 
 
 from tests.factories import ProductFactory
@@ -72,7 +73,8 @@ class TestProductRoutes(TestCase):
     def setUp(self):
         """Runs before each test"""
         self.client = app.test_client()
-        db.session.query(Product).delete()  # clean up the last tests
+        # clean up the last tests
+        db.session.execute(text("TRUNCATE product RESTART IDENTITY CASCADE"))
         db.session.commit()
 
     def tearDown(self):